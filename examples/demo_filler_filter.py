@@ -24,21 +24,28 @@ from typing import List, Optional
 
 # Add extension module path
 repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-extension_path = os.path.join(repo_root, "livekit-agents", "livekit", "agents",
-                            "voice", "extensions", "transcription_filler_filter.py")
-
-# Import FillerFilter directly like the tests do
-import importlib.util
-spec = importlib.util.spec_from_file_location("transcription_filler_filter", extension_path)
-ext = importlib.util.module_from_spec(spec)  # type: ignore
-assert spec and spec.loader
-spec.loader.exec_module(ext)  # type: ignore
-FillerFilter = ext.FillerFilter
-
-if not os.path.exists(extension_path):
+extension_dir = os.path.join(repo_root, "livekit-agents", "livekit", "agents",
+                             "voice", "extensions")
+
+if not os.path.isdir(extension_dir):
     print("Error: Could not find extension module. Please run from repository root.")
     sys.exit(1)
 
+# Import FillerFilter as a plain module like the tests do
+if extension_dir not in sys.path:
+    sys.path.insert(0, extension_dir)
+
+from transcription_filler_filter import FillerFilter  # noqa: E402
+
+# Resolve colorama once at import time; format_state runs on every status
+# refresh and should not re-enter the import machinery (or retry a failing
+# import) each time.
+try:
+    import colorama
+    colorama.init()
+except ImportError:
+    colorama = None  # type: ignore[assignment]
+
 
 class DemoSession:
     """Minimal session-like object that tracks agent state."""
@@ -78,13 +85,10 @@ class DemoActivity:
 
 def format_state(state: str) -> str:
     """Format agent state for display with color if available."""
-    try:
-        import colorama
-        colorama.init()
-        color = colorama.Fore.GREEN if state == "listening" else colorama.Fore.RED
-        return f"{color}{state}{colorama.Style.RESET_ALL}"
-    except ImportError:
+    if colorama is None:
         return state
+    color = colorama.Fore.GREEN if state == "listening" else colorama.Fore.RED
+    return f"{color}{state}{colorama.Style.RESET_ALL}"
 
 
 def print_status(session: DemoSession, activity: DemoActivity) -> None:
@@ -106,12 +110,6 @@ def print_status(session: DemoSession, activity: DemoActivity) -> None:
 
 def main() -> None:
     """Run the interactive demo."""
-    try:
-        import colorama
-        colorama.init()
-    except ImportError:
-        pass
-
     print(__doc__)
     
     # Create our test objects
@@ -150,14 +148,14 @@ def main() -> None:
             
             elif text == "words":
                 print("\nCurrently ignored words/sounds:")
-                for w in sorted(filt._ignored_words):
+                for w in filt._ignored_words:
                     print(f"  - {w}")
                 continue
             
             elif text.startswith("set "):
                 words = text[4:].strip().split(",")
                 filt.set_ignored_words(words)
-                print(f"\nUpdated ignored words to: {sorted(filt._ignored_words)}")
+                print(f"\nUpdated ignored words to: {filt._ignored_words}")
                 continue
             
             # Treat as transcript to filter
@@ -1,7 +1,10 @@
-from _future_ import annotations
+from __future__ import annotations
 
 import os
+import re
+import sys
 import logging
+from functools import lru_cache, partial
 from typing import Any, Iterable, Callable, List, Optional, Dict, Union
 
 # Type aliases for better readability
@@ -9,7 +12,54 @@ TranscriptEvent = Dict[str, Any]  # The shape of our transcript events
 TranscriptHandler = Callable[[TranscriptEvent], Any]  # Handler signature
 AgentActivity = Any  # Type of our activity instances (avoid circular imports)
 
-logger = logging.getLogger(_name_)
+logger = logging.getLogger(__name__)
+
+
+# Translation table that drops punctuation in a single C-level pass, instead of
+# re-parsing a strip() character set for every token.
+_PUNCT_TBL = str.maketrans("", "", ".,!?\"'()[]<>")
+
+# Matches any character the translation table would strip; used to detect
+# transcripts that need no punctuation handling at all.
+_PUNCT_RE = re.compile(r"[.,!?\"'()\[\]<>]")
+
+# Default filler words (English) and background sounds, pre-split so from_env
+# doesn't join and re-parse the same literal on every call.
+_DEFAULT_IGNORED_WORDS: tuple[str, ...] = (
+    # English fillers
+    "uh", "umm", "hmm", "err", "ah", "like", "you know",
+    # Murmurs and non-speech markers
+    "mm", "mhm", "mmm",
+    # Common ASR background markers
+    "[noise]", "[background]", "[inaudible]",
+    # Non-speech vocalizations
+    "[laugh]", "[cough]", "[breath]",
+    # Alternative ASR markers
+    "<noise>", "<silence>", "<background>",
+)
+
+
+def _norm(s: str) -> str:
+    """Normalize a word/token so that markers like "[noise]" match the token "noise"."""
+    return s.strip().lower().translate(_PUNCT_TBL)
+
+
+def _split_tokens(text: str) -> List[str]:
+    # split_words returns (word, start, end) tuples; keep only the word text.
+    return [w for w, _, _ in _split_words(text, split_character=True)]  # type: ignore
+
+
+# The tokenizer choice depends only on whether the tokenize module is importable,
+# so resolve it once at module load: reuse the project's split_words if available,
+# fall back to simple whitespace splitting.
+try:
+    from ..tokenize.basic import split_words as _split_words  # type: ignore
+
+    _split = _split_tokens
+except Exception:
+
+    def _split(text: str) -> List[str]:
+        return text.split()
 
 
 class FillerFilter:
@@ -20,7 +70,8 @@ class FillerFilter:
     interruption ability for real commands.
 
     Attributes:
-        _ignored_words (List[str]): Words to filter during agent speech
+        _ignored_words (List[str]): Words to filter during agent speech (deduplicated, sorted)
+        _ignored_set (frozenset[str]): Pre-normalized ignored words for fast lookup
         _orig_handler_map (Dict[AgentActivity, TranscriptHandler]): Original handlers
 
     Example:
@@ -37,10 +88,10 @@ class FillerFilter:
     - Thread-safe: preserves handler execution context
     - Configurable: via env var or runtime API
     - Language-agnostic: works with any language
-    - Defensive: falls back to original handler on errors
+    - Defensive: malformed events and emit failures degrade to forwarding
     """
 
-    def _init_(self, ignored_words: Optional[Iterable[str]] = None) -> None:
+    def __init__(self, ignored_words: Optional[Iterable[str]] = None) -> None:
         """Initialize a new filler filter.
 
         Args:
@@ -49,9 +100,72 @@ class FillerFilter:
         """
         if ignored_words is None:
             ignored_words = []
-        self._ignored_words: List[str] = [w.strip().lower() for w in ignored_words if w]
+        self._ignored_words: List[str] = sorted({w.strip().lower() for w in ignored_words if w})
+        self._ignored_set: frozenset[str] = frozenset()
+        self._phrases: tuple[tuple[str, ...], ...] = ()
+        self._is_filler_only: Callable[[str], bool] = self._compute_filler_only
+        self._rebuild()
         self._orig_handler_map: Dict[AgentActivity, TranscriptHandler] = {}
 
+    def _rebuild(self) -> None:
+        """Recompute the derived lookup structures from ``_ignored_words``.
+
+        Builds the pre-normalized membership set, plus the token sequences of
+        multi-word entries for the segmentation scan in _compute_filler_only.
+        """
+        # Intern the normalized words: short ASR tokens ("uh", "mm") are often
+        # already interned by the interpreter, letting set lookups succeed on
+        # pointer equality before falling back to a character compare.
+        self._ignored_set = frozenset(
+            sys.intern(n) for n in (_norm(w) for w in self._ignored_words) if n
+        )
+        # Multi-word entries ("you know") can never equal a single token, so
+        # keep them split into token tuples for phrase matching.
+        self._phrases = tuple(tuple(n.split()) for n in self._ignored_set if " " in n)
+        # ASR frequently re-emits identical transcripts ("uh", "mm", ...), so
+        # memoize the pure text -> decision function. Recreating the cache here
+        # invalidates stale decisions whenever the word list changes.
+        self._is_filler_only = lru_cache(maxsize=256)(self._compute_filler_only)
+
+    def _compute_filler_only(self, lowered: str) -> bool:
+        """Return True if a lowered, stripped transcript consists only of ignored words."""
+        ignored = self._ignored_set
+        # Whole-string check catches the single-entry common case, including
+        # multi-word entries like "you know".
+        if lowered.translate(_PUNCT_TBL) in ignored:
+            return True
+        # With no punctuation present, plain whitespace splitting is exact and
+        # the per-token translate pass can be skipped entirely.
+        if _PUNCT_RE.search(lowered) is None:
+            tokens = lowered.split()
+        else:
+            # Tokens that normalize to nothing (pure punctuation) carry no speech.
+            tokens = [t for t in (t.translate(_PUNCT_TBL) for t in _split(lowered)) if t]
+        if not tokens:
+            return False
+        if not self._phrases:
+            # Short-circuit scan: stops at the first non-filler token.
+            return all(t in ignored for t in tokens)
+        # Multi-word entries make single-token membership insufficient, so run a
+        # reachability scan over token positions: a position is reachable when
+        # everything before it segments into ignored tokens and phrases. Linear
+        # in tokens (times the handful of configured phrases), with none of the
+        # backtracking an ambiguous regex alternation would do on overlapping
+        # entries.
+        n = len(tokens)
+        reach = [False] * (n + 1)
+        reach[0] = True
+        for i in range(n):
+            if not reach[i]:
+                continue
+            if tokens[i] in ignored:
+                reach[i + 1] = True
+            for phrase in self._phrases:
+                end = i + len(phrase)
+                if end <= n and not reach[end] and tuple(tokens[i:end]) == phrase:
+                    reach[end] = True
+        return reach[n]
+
     @classmethod
     def from_env(cls, env_var: str = "LIVEKIT_IGNORED_WORDS") -> "FillerFilter":
         """Create a FillerFilter instance configured from environment.
@@ -65,16 +179,7 @@ class FillerFilter:
         """
         raw = os.environ.get(env_var, "")
         if not raw:
-            # Default filler words (English) and background sounds
-            raw = (
-                # English fillers
-                "uh,umm,hmm,err,ah,like,you know,"
-                # Background/non-speech sounds
-                "mm,mhm,mmm,,,,"  # Murmurs and non-speech markers
-                "[noise],[background],[inaudible],"  # Common ASR background markers
-                "[laugh],[cough],[breath],"  # Non-speech vocalizations
-                "<noise>,<silence>,<background>"  # Alternative ASR markers
-            )
+            return cls(_DEFAULT_IGNORED_WORDS)
         parts = [p.strip().lower() for p in raw.split(",") if p.strip()]
         return cls(parts)
 
@@ -85,7 +190,8 @@ class FillerFilter:
             words: List of words to treat as fillers. Each word will be normalized
                   (stripped, lowercased).
         """
-        self._ignored_words = [w.strip().lower() for w in words if w]
+        self._ignored_words = sorted({w.strip().lower() for w in words if w})
+        self._rebuild()
 
     def attach_to_activity(self, activity: AgentActivity) -> None:
         """Attach this filter to an AgentActivity instance.
@@ -110,48 +216,48 @@ class FillerFilter:
 
         orig = activity._on_input_audio_transcription_completed
 
-        def wrapper(ev):
-            try:
-                transcript_text = ev.transcript or ""
-                if (
-                    getattr(activity, "_session", None) is not None
-                    and getattr(activity._session, "agent_state", None) == "speaking"
-                    and transcript_text.strip()
-                    and self._ignored_words
-                ):
-                    # Tokenize: reuse the project's split_words if available, fall back to simple split
-                    try:
-                        from ..tokenize.basic import split_words  # type: ignore
-
-                        tokens = [t.lower().strip(".,!?\"'()[]<>") for t in split_words(transcript_text, split_character=True)]  # type: ignore
-                    except Exception:
-                        tokens = [t.lower().strip(".,!?\"'()[]<>") for t in transcript_text.split()]
-
-                    # Normalize ignored words the same way tokens are normalized so
-                    # that markers like "[noise]" match the token "noise".
-                    def _norm(s: str) -> str:
-                        return s.strip().lower().strip(".,!?\"'()[]<>")
-
-                    ignored_set = {_norm(w) for w in self._ignored_words}
-                    if tokens and all(tok in ignored_set for tok in tokens):
-                        logger.info("Ignored filler-only interruption while agent speaking: %r", transcript_text)
-                        # emit agent_false_interruption for backwards compatibility if session supports it
-                        try:
-                            if activity._session is not None:
-                                activity._session.emit("agent_false_interruption")
-                        except Exception:
-                            logger.debug("failed to emit agent_false_interruption event", exc_info=True)
-                        return
-            except Exception:
-                # On any unexpected error, fall back to original handler to avoid breaking runtime
-                logger.exception("filler filter failed, falling back to original handler")
-
-            return orig(ev)
+        # Bind the shared handler method with the per-activity state instead of
+        # defining a fresh closure: partial of a bound method skips the closure
+        # cell loads on every event. The session is fixed for the lifetime of
+        # the activity, so look it up once here.
+        wrapper = partial(
+            self._handle_transcript,
+            orig=orig,
+            session=getattr(activity, "_session", None),
+        )
 
-        # bind wrapper to instance
         setattr(activity, "_on_input_audio_transcription_completed", wrapper)
         self._orig_handler_map[activity] = orig
 
+    def _handle_transcript(
+        self,
+        ev: Any,
+        *,
+        orig: TranscriptHandler,
+        session: Any,
+    ) -> Any:
+        """Per-event handler installed in place of the activity's original one."""
+        # Bail out before touching the event at all: the filter only has a say
+        # while the agent is speaking, so in any other state (the common case)
+        # the event goes straight to the original handler after one attribute
+        # compare. An empty ignored set likewise means there is nothing to do.
+        if session is None or session.agent_state != "speaking" or not self._ignored_set:
+            return orig(ev)
+
+        # Malformed events without a transcript attribute degrade to forwarding.
+        transcript_text = getattr(ev, "transcript", None) or ""
+        stripped = transcript_text.strip()
+        if stripped and self._is_filler_only(stripped.lower()):
+            logger.info("Ignored filler-only interruption while agent speaking: %r", transcript_text)
+            # emit agent_false_interruption for backwards compatibility if session supports it
+            try:
+                session.emit("agent_false_interruption")
+            except Exception:
+                logger.debug("failed to emit agent_false_interruption event", exc_info=True)
+            return None
+
+        return orig(ev)
+
     def detach_from_activity(self, activity) -> None:
         """Restore the original handler for a previously attached activity."""
         orig = self._orig_handler_map.pop(activity, None)
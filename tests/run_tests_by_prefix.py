@@ -3,11 +3,14 @@
 Run all test files in `tests/` whose filenames start with `tests_` using pytest.
 
 This runner invokes pytest on each matching file individually. Running files
-one-by-one makes it easier to isolate failing tests and debug issues.
+one-by-one makes it easier to isolate failing tests and debug issues, and the
+independent pytest processes are distributed over a process pool so the total
+wall time is bounded by the slowest file rather than the sum.
 
 Usage:
     python tests/run_tests_by_prefix.py
     python tests/run_tests_by_prefix.py --pattern "tests_*.py" --pytest-args "-q -k some_marker"
+    python tests/run_tests_by_prefix.py --jobs 1  # sequential, streamed output
 
 Exit code: 0 when all files pass, 1 when any file fails.
 """
@@ -15,8 +18,10 @@ Exit code: 0 when all files pass, 1 when any file fails.
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
@@ -27,15 +32,25 @@ def find_test_files(tests_dir: Path, pattern: str) -> list[Path]:
     return [p for p in files if p.resolve() != runner]
 
 
-def run_pytest_on_file(py_exe: str, filepath: Path, extra_args: str) -> int:
+def run_pytest_on_file(
+    py_exe: str, filepath: Path, extra_args: str, capture: bool = True
+) -> tuple[int, str]:
+    """Run pytest on a single file, returning (exit code, combined output).
+
+    With capture=False the pytest process inherits stdout/stderr so its output
+    streams live; the returned output string then only holds the header.
+    """
     cmd = [py_exe, "-m", "pytest", str(filepath)]
     if extra_args:
         cmd.extend(extra_args.split())
-    print("\n" + "=" * 80)
-    print(f"Running: {filepath.name}")
-    print("Command:", " ".join(cmd))
-    res = subprocess.run(cmd)
-    return res.returncode
+    header = "\n" + "=" * 80 + f"\nRunning: {filepath.name}\nCommand: " + " ".join(cmd)
+    if not capture:
+        print(header)
+        res = subprocess.run(cmd)
+        return res.returncode, ""
+    res = subprocess.run(cmd, capture_output=True, text=True)
+    output = header + "\n" + res.stdout + res.stderr
+    return res.returncode, output
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -44,6 +59,7 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--pattern", "-p", default="test_*.py", help="glob pattern for test files (default: test_*.py)")
     parser.add_argument("--pytest-args", "-a", default="", help="extra args to pass to pytest (quoted)")
     parser.add_argument("--tests-dir", "-d", default=None, help="directory containing test files (default: script's tests/ folder)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="number of files to run in parallel (default: CPU count)")
     args = parser.parse_args(argv)
 
     # Default to the directory containing this script (tests/)
@@ -67,10 +83,28 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     failures: list[tuple[str, int]] = []
-    for f in files:
-        rc = run_pytest_on_file(sys.executable, f, args.pytest_args)
-        if rc != 0:
-            failures.append((f.name, rc))
+    jobs = max(1, min(args.jobs, len(files)))
+    if jobs == 1:
+        # Sequential mode skips the pool and lets pytest inherit stdout/stderr,
+        # so output streams live (useful for watching slow or hanging files).
+        for f in files:
+            rc, _ = run_pytest_on_file(sys.executable, f, args.pytest_args, capture=False)
+            if rc != 0:
+                failures.append((f.name, rc))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            # map() preserves file order, so output stays deterministic even
+            # though the pytest processes run concurrently.
+            results = pool.map(
+                run_pytest_on_file,
+                [sys.executable] * len(files),
+                files,
+                [args.pytest_args] * len(files),
+            )
+            for f, (rc, output) in zip(files, results):
+                print(output, end="")
+                if rc != 0:
+                    failures.append((f.name, rc))
 
     print("\n" + "=" * 80)
     print(f"Ran {len(files)} test file(s). Failures: {len(failures)}")
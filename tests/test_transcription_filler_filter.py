@@ -1,20 +1,19 @@
 from __future__ import annotations
 
-import types
-
-import importlib.util
 import os
-
-# Import the extension module directly from its file to avoid importing the
-# top-level package (which pulls in optional runtime deps like livekit.rtc).
-ext_path = os.path.join(
-    os.getcwd(), "livekit-agents", "livekit", "agents", "voice", "extensions", "transcription_filler_filter.py"
+import sys
+
+# Import the extension as a plain module (without importing the top-level
+# package, which pulls in optional runtime deps like livekit.rtc) by putting
+# its directory on sys.path.
+ext_dir = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "livekit-agents", "livekit", "agents", "voice", "extensions",
 )
-spec = importlib.util.spec_from_file_location("transcription_filler_filter", ext_path)
-ext = importlib.util.module_from_spec(spec)  # type: ignore
-assert spec and spec.loader
-spec.loader.exec_module(ext)  # type: ignore
-FillerFilter = ext.FillerFilter
+if ext_dir not in sys.path:
+    sys.path.insert(0, ext_dir)
+
+from transcription_filler_filter import FillerFilter  # noqa: E402
 
 
 class FakeSession:
@@ -72,6 +71,34 @@ def test_forward_filler_when_agent_listening():
     assert not any(e[0] == "agent_false_interruption" for e in session.events)
 
 
+def test_ignore_multiword_filler_while_agent_speaking():
+    session = FakeSession(agent_state="speaking")
+    activity = FakeActivity(session)
+    f = FillerFilter.from_env()  # defaults include "you know"
+    f.attach_to_activity(activity)
+
+    ev = Ev("you know")
+    activity._on_input_audio_transcription_completed(ev)
+
+    # multi-word filler entry while speaking -> should be ignored
+    assert activity.forwarded == []
+    assert any(e[0] == "agent_false_interruption" for e in session.events)
+
+
+def test_forward_multiword_filler_when_agent_listening():
+    session = FakeSession(agent_state="listening")
+    activity = FakeActivity(session)
+    f = FillerFilter.from_env()
+    f.attach_to_activity(activity)
+
+    ev = Ev("you know")
+    activity._on_input_audio_transcription_completed(ev)
+
+    # multi-word filler when agent quiet -> forwarded
+    assert activity.forwarded == [("you know", True, None)]
+    assert not any(e[0] == "agent_false_interruption" for e in session.events)
+
+
 def test_forward_mixed_filler_and_command():
     session = FakeSession(agent_state="speaking")
     activity = FakeActivity(session)
@@ -84,3 +111,54 @@ def test_forward_mixed_filler_and_command():
     # mixed filler+command -> forwarded
     assert activity.forwarded == [("umm stop", True, None)]
 
+
+def test_forward_command_with_overlapping_phrase_entries():
+    # Overlapping entries ("you", "know", "you know") made the old regex
+    # alternation backtrack exponentially when the match failed; the
+    # segmentation scan must decide long non-filler transcripts promptly.
+    session = FakeSession(agent_state="speaking")
+    activity = FakeActivity(session)
+    f = FillerFilter(["uh", "you", "know", "you know"])
+    f.attach_to_activity(activity)
+
+    transcript = "you know " * 30 + "stop"
+    ev = Ev(transcript)
+    activity._on_input_audio_transcription_completed(ev)
+
+    # ends in a real command -> forwarded
+    assert activity.forwarded == [(transcript, True, None)]
+
+
+def test_forward_punctuated_command_with_project_tokenizer():
+    # Standalone imports fall back to str.split because the relative import of
+    # tokenize.basic fails; bind a stub with split_words' real return type
+    # (list of (word, start, end) tuples) to cover the packaged code path.
+    import transcription_filler_filter as ext
+
+    def fake_split_words(text, *, split_character=False):
+        out = []
+        pos = 0
+        for w in text.split():
+            start = text.index(w, pos)
+            out.append((w, start, start + len(w)))
+            pos = start + len(w)
+        return out
+
+    orig_split = ext._split
+    ext._split_words = fake_split_words
+    ext._split = ext._split_tokens
+    try:
+        session = FakeSession(agent_state="speaking")
+        activity = FakeActivity(session)
+        f = FillerFilter.from_env()
+        f.attach_to_activity(activity)
+
+        ev = Ev("stop, please!")
+        activity._on_input_audio_transcription_completed(ev)
+
+        # punctuated real command while speaking -> forwarded, not crashed
+        assert activity.forwarded == [("stop, please!", True, None)]
+    finally:
+        ext._split = orig_split
+        del ext._split_words
+
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
-import importlib.util
 import os
+import sys
 
 
-# Import the extension module directly from its file to avoid importing the
-# top-level package (which pulls in optional runtime deps like livekit.rtc).
-ext_path = os.path.join(
-    os.getcwd(), "livekit-agents", "livekit", "agents", "voice", "extensions", "transcription_filler_filter.py"
+# Import the extension as a plain module (without importing the top-level
+# package, which pulls in optional runtime deps like livekit.rtc) by putting
+# its directory on sys.path.
+ext_dir = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "livekit-agents", "livekit", "agents", "voice", "extensions",
 )
-spec = importlib.util.spec_from_file_location("transcription_filler_filter", ext_path)
-ext = importlib.util.module_from_spec(spec)  # type: ignore
-assert spec and spec.loader
-spec.loader.exec_module(ext)  # type: ignore
-FillerFilter = ext.FillerFilter
+if ext_dir not in sys.path:
+    sys.path.insert(0, ext_dir)
+
+from transcription_filler_filter import FillerFilter  # noqa: E402
 
 
 class FakeSession: